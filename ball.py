@@ -205,7 +205,7 @@ class Ball:
         self.moving = False
 
     def distance_to(self, x, y):
-        return math.sqrt((self.x - x) ** 2 + (self.y - y) ** 2)
+        return math.hypot(self.x - x, self.y - y)
 
     def draw(self, screen):
         # Shadow
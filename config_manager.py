@@ -6,10 +6,22 @@ This module handles all configuration saving/loading operations.
 
 import os
 import json
+import hashlib
+try:
+    import orjson  # Optional: faster serializer for config saves
+except Exception:
+    orjson = None
 from pathlib import Path
 from typing import Dict, Any, Optional
 from resource_manager import _get_base_path
 
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """Serialize config data to UTF-8 JSON bytes, indented so the file stays hand-editable."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 class ConfigManager:
     """Manages game configuration."""
     
@@ -17,6 +29,8 @@ class ConfigManager:
         self._config_file = "game_config.json"
         self._base_path = _get_base_path()
         self._config_data = {}
+        # Digest of the bytes last read from / written to disk, to skip no-op saves
+        self._last_saved_hash = None
         
         # Save configuration in the same directory as the game
         self._config_dir = self._base_path
@@ -33,8 +47,10 @@ class ConfigManager:
         """Load configuration from file."""
         try:
             if self._config_path.exists():
-                with open(self._config_path, 'r', encoding='utf-8') as f:
-                    self._config_data = json.load(f)
+                with open(self._config_path, 'rb') as f:
+                    raw = f.read()
+                self._config_data = json.loads(raw.decode('utf-8'))
+                self._last_saved_hash = self._payload_hash(raw)
             else:
                 # Initialize with defaults from constants
                 self._initialize_defaults()
@@ -69,13 +85,32 @@ class ConfigManager:
                 'game_settings': {'difficulty': 'medium', 'singleplayer': True}
             }
     
+    @staticmethod
+    def _payload_hash(payload: bytes) -> bytes:
+        """Fast digest used to detect unchanged configuration payloads."""
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
     def save_config(self):
-        """Save configuration to file."""
+        """Save configuration to file, skipping the write if the content is unchanged."""
+        # Write to a temp file and swap it in so a crash never leaves a partial config
+        tmp_path = self._config_path.with_name(self._config_path.name + '.tmp')
         try:
-            with open(self._config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config_data, f, indent=2, ensure_ascii=False)
+            payload = _dumps(self._config_data)
+            payload_hash = self._payload_hash(payload)
+            if payload_hash == self._last_saved_hash and self._config_path.exists():
+                return
+            
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, self._config_path)
+            self._last_saved_hash = payload_hash
         except Exception as e:
             print(f"Warning: Failed to save config to {self._config_path}: {e}")
+            # Don't leave a partial temp file behind (disk full, etc.)
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
     
     def get(self, section: str, key: str, default: Any = None) -> Any:
         """Get a configuration value."""
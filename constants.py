@@ -18,6 +18,7 @@ YELLOW = (255, 255, 0)
 ORANGE = (255, 165, 0)
 GRAY = (128, 128, 128)
 LIGHT_GRAY = (200, 200, 200)
+GRASS_STRIPE_COLOR = (30, 180, 30)
 
 # Difficulty colors
 LIME = (0, 255, 0)
@@ -26,6 +27,12 @@ DIFFICULTY_RED = (255, 0, 0)
 DARK_RED = (127, 0, 0)
 # UI Colors for better contrast
 MENU_TEXT_COLOR = (240, 240, 240)  # Light gray, better than pure white for contrast
+# Custom tactics editor
+EDITOR_SAVE_BUTTON_COLOR = (60, 120, 60)
+EDITOR_SAVE_BUTTON_HOVER_COLOR = (100, 150, 100)
+EDITOR_RESET_BUTTON_COLOR = (120, 60, 60)
+EDITOR_RESET_BUTTON_HOVER_COLOR = (150, 100, 100)
+EDITOR_BALL_ZONE_COLOR = (255, 255, 0, 60)  # Semi-transparent yellow
 
 # Field dimensions - adjusted for larger goals
 FIELD_WIDTH = 1100  # Reduced from 1220 to accommodate larger goals
@@ -22,7 +22,7 @@ class Field:
         for i in range(stripe_count):
             if i % 2 == 0:
                 stripe_rect = pygame.Rect(self.x + i * stripe_width, self.y, stripe_width, self.height)
-                pygame.draw.rect(screen, (30, 180, 30), stripe_rect)
+                pygame.draw.rect(screen, GRASS_STRIPE_COLOR, stripe_rect)
 
         # Border
         pygame.draw.rect(screen, WHITE, (self.x, self.y, self.width, self.height), 3)
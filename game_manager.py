@@ -818,11 +818,12 @@ class GameManager:
                         collision_pairs.append((p1, p2))
             
             # Dynamic solver iterations based on velocities
-            max_velocity = max((math.sqrt(p.vx**2 + p.vy**2) for p in all_players), default=0)
+            # Compared squared (200**2, 100**2) to skip a sqrt per player
+            max_velocity_sq = max((p.vx*p.vx + p.vy*p.vy for p in all_players), default=0)
             solver_iterations = PHYSICS_SOLVER_ITERATIONS
-            if max_velocity > 200:
+            if max_velocity_sq > 40000:
                 solver_iterations *= 3
-            elif max_velocity > 100:
+            elif max_velocity_sq > 10000:
                 solver_iterations *= 2
             
             for iteration in range(solver_iterations):
@@ -858,10 +859,11 @@ class GameManager:
                     nearby_players.append(p)
             
             # Enhanced ball-player collision with CCD and dynamic iterations
-            ball_velocity = math.sqrt(self.ball.vx**2 + self.ball.vy**2)
+            ball_velocity_sq = self.ball.vx*self.ball.vx + self.ball.vy*self.ball.vy
             ball_iterations = PHYSICS_SOLVER_ITERATIONS * 2
-            if ball_velocity > 200:
+            if ball_velocity_sq > 40000:  # 200**2
                 ball_iterations *= 2  # Extra iterations for high-speed ball
+            use_ccd = ball_velocity_sq > CCD_VELOCITY_THRESHOLD * CCD_VELOCITY_THRESHOLD
             
             for iteration in range(ball_iterations):
                 collision_resolved = False
@@ -872,7 +874,7 @@ class GameManager:
                         continue
                     
                     # Use swept collision detection for high-speed scenarios
-                    if ball_velocity > CCD_VELOCITY_THRESHOLD:
+                    if use_ccd:
                         impact_time = swept_circle_collision(self.ball, p, 1.0)
                         if impact_time is not None and impact_time < 0.5:  # Collision imminent
                             # Pre-emptive collision response
@@ -33,6 +33,9 @@ class MiniFootballGame:
         
         # Game running flag
         self.running = True
+        
+        # Game state of the last frame drawn; idle editor frames are not repainted
+        self._drawn_state = None
 
         # Pause animation state
         self.pause_frames = []           # list[Surface]
@@ -152,6 +155,12 @@ class MiniFootballGame:
     def handle_events(self):
         """Handle all pygame events"""
         for event in pygame.event.get():
+            # Key presses, clicks and window events can change what the editor
+            # shows; mouse motion marks it dirty itself when it matters
+            if (event.type != pygame.MOUSEMOTION and
+                    self.game_manager.game_state == GAME_STATE_CUSTOM_TACTICS):
+                self.game_manager.custom_tactics_editor.request_redraw()
+            
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -309,6 +318,14 @@ class MiniFootballGame:
     
     def draw(self):
         """Draw everything to the screen"""
+        # The custom tactics editor is static unless edited, hovered, blinking
+        # or fading; keep the last frame on screen while it is idle
+        state = self.game_manager.game_state
+        if (state == GAME_STATE_CUSTOM_TACTICS and self._drawn_state == state and
+                not self.game_manager.custom_tactics_editor.needs_redraw()):
+            return
+        self._drawn_state = state
+        
         # Clear screen
         self.screen.fill(BLACK)
         
@@ -162,7 +162,7 @@ class Player:
     
     def distance_to(self, other_x, other_y):
         """Calculate distance to a point"""
-        return math.sqrt((self.x - other_x)**2 + (self.y - other_y)**2)
+        return math.hypot(self.x - other_x, self.y - other_y)
     
     def distance_to_player(self, other_player):
         """Calculate distance to another player"""
@@ -170,8 +170,10 @@ class Player:
     
     def collides_with(self, other_x, other_y, other_radius):
         """Check collision with another circular object"""
-        distance = self.distance_to(other_x, other_y)
-        return distance < (self.radius + other_radius)
+        dx = self.x - other_x
+        dy = self.y - other_y
+        min_distance = self.radius + other_radius
+        return dx*dx + dy*dy < min_distance*min_distance  # Skip sqrt for comparison
     
     def collides_with_player(self, other_player):
         """Check collision with another player"""
@@ -10,6 +10,10 @@ import sys
 from pathlib import Path
 from typing import Optional, List
 
+# Resolved once at import; the application directory never moves at runtime
+_BASE_PATH = Path(__file__).parent.absolute()
+_ASSETS_PATH = _BASE_PATH / "assets"
+
 def _get_base_path() -> Path:
     """
     Get the base path for resources in development mode.
@@ -17,7 +21,7 @@ def _get_base_path() -> Path:
     Returns:
         Path object pointing to the application directory
     """
-    return Path(__file__).parent.absolute()
+    return _BASE_PATH
 
 def get_asset_path(filename: str) -> str:
     """
@@ -29,10 +33,7 @@ def get_asset_path(filename: str) -> str:
     Returns:
         String path to the asset file
     """
-    base_path = _get_base_path()
-    assets_path = base_path / "assets"
-    asset_path = assets_path / filename
-    return str(asset_path)
+    return str(_ASSETS_PATH / filename)
 
 def get_resource_path(relative_path: str) -> str:
     """
@@ -107,8 +108,7 @@ def get_assets_dir() -> str:
     Returns:
         String path to assets directory
     """
-    base_path = _get_base_path()
-    return str(base_path / "assets")
+    return str(_ASSETS_PATH)
 
 def debug_info() -> dict:
     """
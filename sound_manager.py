@@ -1,3 +1,6 @@
+import array
+import functools
+import hashlib
 import io
 import math
 import struct
@@ -7,23 +10,117 @@ from typing import Optional
 
 import pygame
 import os
+try:
+    import numpy as np  # Optional: vectorized PCM processing
+except Exception:
+    np = None
 from constants import SOUND_DIR_NAME, SOUND_FILES
-from resource_manager import get_asset_path, get_resource_path
+from resource_manager import get_assets_dir, get_resource_path
+
+# Synthesized fallback tones are cached here as WAV files across launches
+_TONE_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'footballsim',
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _sine_wave_cached(sr: int, freq: float, length_ms: int, volume: float = 0.5) -> bytes:
+    """Generate 16-bit PCM mono sine wave bytes (memoized, output is immutable)."""
+    total_samples = int(sr * (length_ms / 1000.0))
+    max_amp = int(32767 * max(0.0, min(volume, 1.0)))
+    two_pi_f_over_sr = 2 * math.pi * freq / sr
+
+    if np is not None:
+        # One buffer reused in place for phase, sine and amplitude
+        wave = np.arange(total_samples, dtype=np.float64)
+        wave *= two_pi_f_over_sr
+        np.sin(wave, out=wave)
+        wave *= max_amp
+        return wave.astype('<i2').tobytes()
+
+    # Pure-Python fallback: bind hot names locally to skip global/attribute lookups
+    _sin = math.sin
+    _int = int
+    samples = array.array('h', [_int(max_amp * _sin(two_pi_f_over_sr * n))
+                                for n in range(total_samples)])
+    if sys.byteorder != 'little':
+        samples.byteswap()
+    return samples.tobytes()
+
+
+def _fade_out_pcm(pcm, sr: int, fade_out_ms: int) -> None:
+    """Apply a quick linear fade-out to avoid clicks at the end.
+
+    ``pcm`` is any writable buffer of 16-bit samples (bytearray or int16 ndarray).
+    """
+    if fade_out_ms <= 0:
+        return
+    bytes_per_sample = 2  # 16-bit mono
+    total_samples = memoryview(pcm).nbytes // bytes_per_sample
+    fade_samples = int(sr * (fade_out_ms / 1000.0))
+    fade_samples = min(fade_samples, total_samples)
+    if fade_samples <= 0:
+        return
+
+    if np is not None:
+        # Writable int16 view over the buffer; scale the tail in one pass
+        arr = np.frombuffer(memoryview(pcm), dtype='<i2', count=total_samples)
+        ramp = np.linspace(1.0 / fade_samples, 1.0, fade_samples, dtype=np.float32)[::-1]
+        arr[-fade_samples:] = (arr[-fade_samples:].astype(np.float32) * ramp).astype('<i2')
+        return
+
+    start = total_samples - fade_samples
+    if sys.byteorder == 'little':
+        # Native int16 view of the existing buffer: in-place writes, no struct calls
+        samples = memoryview(pcm).cast('B').cast('h')
+        for i in range(fade_samples):
+            samples[start + i] = int(samples[start + i] * ((fade_samples - i) / fade_samples))
+        return
+
+    for i in range(fade_samples):
+        idx = (start + i) * bytes_per_sample
+        val = struct.unpack_from('<h', pcm, idx)[0]
+        scale = (fade_samples - i) / fade_samples
+        struct.pack_into('<h', pcm, idx, int(val * scale))
+
+
+def _mono_to_stereo(pcm) -> bytes:
+    """Duplicate 16-bit mono samples into interleaved stereo frames."""
+    if np is not None:
+        return np.frombuffer(pcm, dtype='<i2').repeat(2).tobytes()
+    mono = array.array('h')
+    mono.frombytes(pcm)
+    stereo = array.array('h', bytes(2 * len(mono) * mono.itemsize))
+    stereo[0::2] = mono
+    stereo[1::2] = mono
+    return stereo.tobytes()
+
+
+@functools.lru_cache(maxsize=32)
+def _faded_tone_cached(sr: int, freq: float, length_ms: int, volume: float, fade_out_ms: int) -> bytes:
+    """Sine tone with fade-out applied, memoized so repeat builds skip synthesis."""
+    pcm = bytearray(_sine_wave_cached(sr, freq, length_ms, volume))
+    _fade_out_pcm(pcm, sr, fade_out_ms)
+    return bytes(pcm)
 
 
 class SoundManager:
     """Lightweight sound helper that generates small WAV tones at runtime.
 
-    - No external files or numpy required.
+    - No external files required; numpy is used for PCM processing when available.
     - Fails safe if audio device/mixer is not available.
     - Simple rate-limiting to avoid spam on physics iterations.
     """
 
+    # Filename index of the assets folder, shared by all instances
+    _sound_index: Optional[dict] = None
+
     def __init__(self):
         self.enabled = False
         self.sample_rate = 44100
-        self._last_collision_ms = 0
-        self._collision_cooldown_ms = 80
+        self._last_collision_ns = 0
+        self._collision_cooldown_ns = 80_000_000  # 80 ms
 
         try:
             if not pygame.mixer.get_init():
@@ -33,6 +130,18 @@ class SoundManager:
             # No audio device or mixer failed; keep sounds disabled
             self.enabled = False
 
+        # Raw PCM can be handed to the mixer only if it runs our rate and sample
+        # format. pygame.init() usually opens it first in stereo, so mono tones
+        # are then duplicated into both channels (see _sound_from_pcm)
+        mixer_format = pygame.mixer.get_init() if self.enabled else None
+        self._raw_pcm_channels = 0
+        if (mixer_format and mixer_format[:2] == (self.sample_rate, -16)
+                and mixer_format[2] in (1, 2) and sys.byteorder == 'little'):
+            self._raw_pcm_channels = mixer_format[2]
+
+        # Index the assets folder once instead of probing each candidate file
+        self._sound_index = self._scan_sound_dirs()
+
         # Try load external assets first, else synthesize
         self._collision_sound = self._try_load_external("collision")
         self._goal_sound = self._try_load_external("goal")
@@ -50,11 +159,12 @@ class SoundManager:
         self._end_tie_music = self._try_load_music_file("end_tie.mp3")  # Tie game
         self._end_2p_music = self._try_load_music_file("end_2p.mp3")  # Multiplayer ending
         
-        # Track pause audio channel for stopping
+        # Track pause audio channel (and its mixer index) for stopping
         self._pause_audio_channel = None
+        self._pause_audio_channel_id: Optional[int] = None
         
-        # Track which sound channels are paused by us (to avoid pausing pause audio)
-        self._paused_channels = set()
+        # Indices of the sound channels paused by us (to avoid pausing pause audio)
+        self._paused_channel_ids = set()
         
         # Track current music state
         self._current_music_type = None  # 'menu', 'ingame', or None
@@ -65,44 +175,41 @@ class SoundManager:
         self.sfx_volume = 1
         self.bgm_volume = 1
 
-        # Generate fallback tones only if external sounds are missing
-        if not self._collision_sound:
-            self._collision_tone_soft = self._build_tone(freq=420, ms=55, volume=0.45)
-            self._collision_tone_hard = self._build_tone(freq=700, ms=45, volume=0.55)
-        else:
-            self._collision_tone_soft = self._collision_tone_hard = None
+        # Fallback tones (_collision_tone_*, _goal_fanfare, _pause_tone) are
+        # synthesized lazily on first use, and only if external sounds are missing
+
+    @functools.cached_property
+    def _collision_tone_soft(self) -> Optional[pygame.mixer.Sound]:
+        return None if self._collision_sound else self._build_tone(freq=420, ms=55, volume=0.45)
+
+    @functools.cached_property
+    def _collision_tone_hard(self) -> Optional[pygame.mixer.Sound]:
+        return None if self._collision_sound else self._build_tone(freq=700, ms=45, volume=0.55)
 
-        self._goal_fanfare = None if self._goal_sound else self._build_fanfare()
-        self._pause_tone = None if self._pause_sound else self._build_tone(freq=520, ms=90, volume=0.5)
+    @functools.cached_property
+    def _goal_fanfare(self) -> Optional[pygame.mixer.Sound]:
+        return None if self._goal_sound else self._build_fanfare()
+
+    @functools.cached_property
+    def _pause_tone(self) -> Optional[pygame.mixer.Sound]:
+        return None if self._pause_sound else self._build_tone(freq=520, ms=90, volume=0.5)
+
+    @functools.cached_property
+    def _best_collision_snd(self) -> Optional[pygame.mixer.Sound]:
+        # Resolved once; play_collision runs at physics rate
+        return self._collision_sound or self._collision_tone_hard or self._collision_tone_soft
 
     def _sine_wave(self, freq: float, length_ms: int, volume: float = 0.5) -> bytes:
         """Generate 16-bit PCM mono sine wave bytes."""
-        sr = self.sample_rate
-        total_samples = int(sr * (length_ms / 1000.0))
-        max_amp = int(32767 * max(0.0, min(volume, 1.0)))
-
-        frames = bytearray()
-        for n in range(total_samples):
-            t = n / sr
-            # Simple sine
-            sample = int(max_amp * math.sin(2 * math.pi * freq * t))
-            frames += struct.pack('<h', sample)
-        return bytes(frames)
+        return _sine_wave_cached(self.sample_rate, freq, length_ms, volume)
+
+    def _sine_wave_arr(self, freq: float, length_ms: int, volume: float = 0.5):
+        """Read-only int16 view over the cached sine bytes (requires numpy)."""
+        return np.frombuffer(self._sine_wave(freq, length_ms, volume), dtype='<i2')
 
     def _apply_linear_fade(self, pcm: bytearray, fade_out_ms: int) -> None:
         """Apply a quick linear fade-out to avoid clicks at the end."""
-        if fade_out_ms <= 0:
-            return
-        bytes_per_sample = 2  # 16-bit mono
-        total_samples = len(pcm) // bytes_per_sample
-        fade_samples = int(self.sample_rate * (fade_out_ms / 1000.0))
-        fade_samples = min(fade_samples, total_samples)
-        for i in range(fade_samples):
-            idx = (total_samples - 1 - i) * bytes_per_sample
-            val = struct.unpack_from('<h', pcm, idx)[0]
-            scale = (fade_samples - i) / fade_samples
-            new_val = int(val * scale)
-            struct.pack_into('<h', pcm, idx, new_val)
+        _fade_out_pcm(pcm, self.sample_rate, fade_out_ms)
 
     def _wav_bytes(self, pcm_bytes: bytes) -> io.BytesIO:
         """Wrap raw PCM bytes into a minimal WAV in-memory file-like object."""
@@ -114,62 +221,99 @@ class SoundManager:
         fmt_chunk_size = 16
         riff_chunk_size = 4 + (8 + fmt_chunk_size) + (8 + data_size)
 
-        buf = io.BytesIO()
-        # RIFF header
-        buf.write(b'RIFF')
-        buf.write(struct.pack('<I', riff_chunk_size))
-        buf.write(b'WAVE')
-        # fmt chunk
-        buf.write(b'fmt ')  # chunk id
-        buf.write(struct.pack('<I', fmt_chunk_size))  # chunk size
-        buf.write(struct.pack('<H', 1))  # PCM
-        buf.write(struct.pack('<H', num_channels))
-        buf.write(struct.pack('<I', self.sample_rate))
-        buf.write(struct.pack('<I', byte_rate))
-        buf.write(struct.pack('<H', block_align))
-        buf.write(struct.pack('<H', bits_per_sample))
-        # data chunk
-        buf.write(b'data')
-        buf.write(struct.pack('<I', data_size))
-        buf.write(pcm_bytes)
-        buf.seek(0)
-        return buf
+        # Whole 44-byte RIFF/fmt/data header in a single pack call
+        header = struct.pack(
+            '<4sI4s4sIHHIIHH4sI',
+            b'RIFF', riff_chunk_size, b'WAVE',
+            b'fmt ', fmt_chunk_size, 1, num_channels,  # PCM
+            self.sample_rate, byte_rate, block_align, bits_per_sample,
+            b'data', data_size,
+        )
+        return io.BytesIO(header + pcm_bytes)
 
     def _build_tone(self, freq: float, ms: int, volume: float = 0.5) -> Optional[pygame.mixer.Sound]:
         if not self.enabled:
             return None
-        pcm = bytearray(self._sine_wave(freq=freq, length_ms=ms, volume=volume))
-        self._apply_linear_fade(pcm, fade_out_ms=18)
-        wav_file = self._wav_bytes(bytes(pcm))
+        key = f'{self.sample_rate}-{freq}-{ms}-{volume}-fade18'
+        return self._load_or_build_sound(
+            key, lambda: _faded_tone_cached(self.sample_rate, freq, ms, volume, 18))
+
+    def _load_or_build_sound(self, key: str, build_pcm) -> Optional[pygame.mixer.Sound]:
+        """Load a synthesized sound from the disk cache, or build and store it.
+
+        ``key`` must describe everything that determines the PCM output.
+        """
+        digest = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+        path = os.path.join(_TONE_CACHE_DIR, f'tone_{digest}.wav')
+        if os.path.isfile(path):
+            try:
+                return pygame.mixer.Sound(file=path)
+            except Exception:
+                pass  # Unreadable cache entry; rebuild and overwrite it
+
+        pcm = build_pcm()
+        # One WAV buffer serves both the cache file and, if needed, the Sound
+        wav = self._wav_bytes(pcm)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
         try:
-            return pygame.mixer.Sound(file=wav_file)
+            os.makedirs(_TONE_CACHE_DIR, exist_ok=True)
+            with open(tmp_path, 'wb') as f, wav.getbuffer() as view:
+                f.write(view)
+            os.replace(tmp_path, path)  # Atomic, readers never see a partial file
+        except OSError:
+            # Cache is best-effort (read-only home, disk full, etc.); don't leave
+            # a partial temp file behind
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+        return self._sound_from_pcm(pcm, wav)
+
+    def _sound_from_pcm(self, pcm_bytes: bytes, wav: Optional[io.BytesIO] = None) -> Optional[pygame.mixer.Sound]:
+        """Create a Sound from 16-bit mono PCM, skipping the WAV wrapper when possible.
+
+        ``wav`` may carry an already-built WAV of the same PCM to avoid rebuilding it.
+        """
+        if self._raw_pcm_channels:
+            raw = _mono_to_stereo(pcm_bytes) if self._raw_pcm_channels == 2 else pcm_bytes
+            try:
+                return pygame.mixer.Sound(buffer=raw)
+            except TypeError:
+                # Old pygame without buffer= support; use the WAV path below
+                pass
+            except Exception:
+                return None
+        try:
+            return pygame.mixer.Sound(file=wav if wav is not None else self._wav_bytes(pcm_bytes))
         except Exception:
             return None
 
-    def _concat_pcm(self, parts: list[bytes]) -> bytes:
-        return b''.join(parts)
-
     def _build_fanfare(self) -> Optional[pygame.mixer.Sound]:
         if not self.enabled:
             return None
         # Simpler, shorter fanfare to reduce memory usage
         notes = [(784, 120, 0.5), (988, 120, 0.5), (1175, 180, 0.5)]  # Shorter durations
-        pcm_concat = self._concat_pcm([
-            self._sine_wave(f, d, v) for f, d, v in notes
-        ])
-        try:
-            return pygame.mixer.Sound(file=self._wav_bytes(pcm_concat))
-        except Exception:
-            return None
+        key = f'{self.sample_rate}-fanfare-{notes}-fade18'
+        return self._load_or_build_sound(key, lambda: self._fanfare_pcm(notes))
+
+    def _fanfare_pcm(self, notes: list) -> bytes:
+        if np is not None:
+            # Concatenate views of the cached notes straight into one buffer
+            pcm = np.concatenate([self._sine_wave_arr(f, d, v) for f, d, v in notes])
+        else:
+            pcm = bytearray(b''.join(self._sine_wave(f, d, v) for f, d, v in notes))
+        self._apply_linear_fade(pcm, fade_out_ms=18)
+        return bytes(pcm)
 
     def play_collision(self):
         if not self.enabled:
             return
-        now = pygame.time.get_ticks() if pygame.get_init() else int(time.time() * 1000)
-        if now - self._last_collision_ms < self._collision_cooldown_ms:
+        # Monotonic clock avoids an SDL call; most calls end here during the cooldown
+        now_ns = time.monotonic_ns()
+        if now_ns - self._last_collision_ns < self._collision_cooldown_ns:
             return
-        self._last_collision_ms = now
-        snd = self._collision_sound or self._collision_tone_hard or self._collision_tone_soft
+        self._last_collision_ns = now_ns
+        snd = self._best_collision_snd
         if snd is not None:
             try:
                 snd.set_volume(self._apply_sfx_volume())
@@ -210,10 +354,23 @@ class SoundManager:
             try:
                 # Apply BGM volume since pause audio is background music
                 self._pause_audio.set_volume(self._apply_bgm_volume())
-                self._pause_audio_channel = self._pause_audio.play(-1)
+                self._play_pause_audio_loop()
             except Exception:
                 pass
     
+    def _play_pause_audio_loop(self):
+        """Loop pause audio on a free channel, remembering the channel index."""
+        for i in range(pygame.mixer.get_num_channels()):
+            channel = pygame.mixer.Channel(i)
+            if not channel.get_busy():
+                channel.play(self._pause_audio, loops=-1)
+                self._pause_audio_channel = channel
+                self._pause_audio_channel_id = i
+                return
+        # Every channel busy: let pygame pick one, index unknown
+        self._pause_audio_channel = self._pause_audio.play(-1)
+        self._pause_audio_channel_id = None
+    
     def ensure_pause_audio_playing(self):
         """Ensure pause audio is still playing, restart if needed."""
         if not self.enabled or self._pause_audio is None:
@@ -224,7 +381,7 @@ class SoundManager:
             # Channel stopped or was never started, restart it
             try:
                 self._pause_audio.set_volume(self._apply_bgm_volume())
-                self._pause_audio_channel = self._pause_audio.play(-1)
+                self._play_pause_audio_loop()
             except Exception:
                 pass
     
@@ -239,6 +396,24 @@ class SoundManager:
                 pass
             finally:
                 self._pause_audio_channel = None
+                self._pause_audio_channel_id = None
+
+    @classmethod
+    def _scan_sound_dirs(cls) -> dict:
+        """List the assets folder once and map lowercase filenames to paths."""
+        if cls._sound_index is None:
+            index = {}
+            assets_dir = get_assets_dir()
+            try:
+                # scandir reports file type from the directory entry, no stat per file
+                with os.scandir(assets_dir) as entries:
+                    for entry in entries:
+                        if entry.is_file():
+                            index[entry.name.lower()] = entry.path
+            except OSError:
+                pass
+            cls._sound_index = index
+        return cls._sound_index
 
     def _try_load_external(self, key: str) -> Optional[pygame.mixer.Sound]:
         """Attempt to load a sound from the assets folder."""
@@ -247,10 +422,11 @@ class SoundManager:
         candidates = SOUND_FILES.get(key, [])
         
         for name in candidates:
+            sound_path = self._sound_index.get(name.lower())
+            if sound_path is None:
+                continue
             try:
-                sound_path = get_asset_path(name)
-                if os.path.isfile(sound_path):
-                    return pygame.mixer.Sound(sound_path)
+                return pygame.mixer.Sound(sound_path)
             except Exception:
                 continue
         return None
@@ -259,14 +435,7 @@ class SoundManager:
         """Try to find a music file and return its path, or None if not found."""
         if not self.enabled:
             return None
-        
-        try:
-            music_path = get_asset_path(filename)
-            if os.path.isfile(music_path):
-                return music_path
-        except Exception:
-            pass
-        return None
+        return self._sound_index.get(filename.lower())
 
     def play_menu_music(self):
         """Start playing menu background music in a loop."""
@@ -397,9 +566,9 @@ class SoundManager:
             for i in range(num_channels):
                 channel = pygame.mixer.Channel(i)
                 if channel.get_busy():
-                    # Pause this channel and track it for later resume
+                    # Pause this channel and track its index for later resume
                     channel.pause()
-                    self._paused_channels.add(channel)
+                    self._paused_channel_ids.add(i)
         except Exception:
             pass
     
@@ -409,16 +578,15 @@ class SoundManager:
             return
         
         try:
-            # Resume only the channels we paused, but skip pause audio channel
-            channels_to_resume = []
-            for channel in self._paused_channels:
-                # Don't resume the pause audio channel
-                if channel != self._pause_audio_channel:
-                    channels_to_resume.append(channel)
-                    channel.unpause()
+            # Resume only the channels we paused, but skip pause audio channel.
+            # Channel objects compare by identity, so match on the mixer index.
+            pause_audio_id = self._pause_audio_channel_id
+            for channel_id in self._paused_channel_ids:
+                if channel_id != pause_audio_id:
+                    pygame.mixer.Channel(channel_id).unpause()
             
-            # Update our tracking to only include channels we actually resumed
-            self._paused_channels.clear()
+            # Everything we paused has been handled (resumed or owned by pause audio)
+            self._paused_channel_ids.clear()
         except Exception:
             pass
 
@@ -4,11 +4,62 @@ Manages player formations and tactical setups
 """
 import pygame
 import math
+import random
 from constants import *
 from config_manager import get_custom_tactics, set_custom_tactics
 
+# Valid custom tactic slot keys ('custom1' .. 'custom6')
+_CUSTOM_SLOTS = frozenset(f'custom{i}' for i in range(1, 7))
+
+# Default balanced formation for a new custom tactic
+_DEFAULT_CUSTOM_POSITIONS = (
+    (FIELD_WIDTH * 0.1, FIELD_HEIGHT * 0.5),   # Goalkeeper
+    (FIELD_WIDTH * 0.25, FIELD_HEIGHT * 0.25), # Defender 1
+    (FIELD_WIDTH * 0.25, FIELD_HEIGHT * 0.75), # Defender 2
+    (FIELD_WIDTH * 0.4, FIELD_HEIGHT * 0.35),  # Midfielder
+    (FIELD_WIDTH * 0.4, FIELD_HEIGHT * 0.65),  # Forward
+)
+
+# Allowed player center range for tactic validation (player fully on the field)
+_BOUNDS_MIN = PLAYER_RADIUS
+_BOUNDS_MAX_X = FIELD_WIDTH - PLAYER_RADIUS
+_BOUNDS_MAX_Y = FIELD_HEIGHT - PLAYER_RADIUS
+# Editor drags are further limited to team 1's half
+_DRAG_MAX_X = FIELD_WIDTH // 2 - PLAYER_RADIUS
+
+# Help lines shown under the custom tactics editor buttons
+_EDITOR_INSTRUCTIONS = (
+    "Click and drag players to position them",
+    "Press T to switch between teams",
+    "Click buttons or use keyboard shortcuts",
+    "ESC to exit (prompts if unsaved changes)",
+    "Yellow zones show ball positions - keep players clear!",
+)
+
 class TacticsManager:
     def __init__(self):
+        # Memoized get_tactic_positions results keyed by (tactic_key, team);
+        # cleared whenever custom tactics change
+        self._pos_cache = {}
+        
+        # get_available_tactics result, rebuilt after custom tactics change
+        self._available_cache = None
+        
+        # Prebuilt + existing custom tactic keys for random selection, rebuilt
+        # after custom tactics change
+        self._all_keys_cache = None
+        
+        # Formation preview font and pre-rendered player numbers 1-5, created on
+        # first draw (needs pygame.font initialized)
+        self._preview_font = None
+        self._digit_surfs = ()
+        
+        # Rotated preview offsets per (tactic_key, team, scale); see _preview_layout
+        self._preview_layout_cache = {}
+        
+        # Scale-dependent preview dimensions per scale; see _preview_constants
+        self._preview_const_cache = {}
+        
         # Define 4 prebuilt tactics/formations
         self.prebuilt_tactics = {
             'defensive': {
@@ -53,22 +104,61 @@ class TacticsManager:
             }
         }
         
-        # Custom tactics slots (loaded from config manager)
-        self.custom_tactics = get_custom_tactics()
-        if not self.custom_tactics:
-            # Initialize with defaults if empty
-            self.custom_tactics = DEFAULT_CUSTOM_TACTICS.copy()
-            set_custom_tactics(self.custom_tactics)  # Load from constants
+        # Prebuilt formations are static: mirror them for team 2 once
+        for tactic in self.prebuilt_tactics.values():
+            tactic['positions_mirrored'] = tuple(self.mirror_positions_for_team2(tactic['positions']))
+        self._prebuilt_keys = tuple(self.prebuilt_tactics)
+        
+        # Team 2 mirrors of custom tactics, kept out of custom_tactics so they are
+        # never persisted to the config file
+        self._custom_mirrored = {}
+        
+        # Custom tactics slots, loaded from the config manager on first access
+        # (see the custom_tactics property)
+        self._custom_tactics = None
+        
+        # Ball zones never move (field constants), so precompute them once as
+        # (x, y, required_distance, required_distance**2) for conflict checks
+        self._ball_zones = tuple(
+            (info['position'][0], info['position'][1],
+             PLAYER_RADIUS + info['radius'], (PLAYER_RADIUS + info['radius']) ** 2)
+            for info in self.get_ball_positions()
+        )
+        # Kickoff spots are offset symmetrically from the center, so every ball zone
+        # has a mirror image about the center line and a mirrored team 2 has the
+        # same ball conflicts as team 1. Checked once here in case the zones change.
+        zone_keys = {(bx, by, req) for bx, by, req, _ in self._ball_zones}
+        self._symmetric_ball_zones = all(
+            (FIELD_WIDTH - bx, by, req) in zone_keys for bx, by, req, _ in self._ball_zones
+        )
+        # Bounding box (left, top, right, bottom) around all ball zones; players
+        # outside it cannot conflict with any zone
+        self._ball_zones_box = (
+            min(bx - req for bx, _, req, _ in self._ball_zones),
+            min(by - req for _, by, req, _ in self._ball_zones),
+            max(bx + req for bx, _, req, _ in self._ball_zones),
+            max(by + req for _, by, req, _ in self._ball_zones),
+        )
         
         # Currently selected tactics
         self.team1_selected_tactic = 'balanced'  # Default
         self.team2_selected_tactic = 'balanced'  # Default
-        
-        # Load custom tactics from constants if they exist
-        self.load_custom_tactics()
+    
+    @property
+    def custom_tactics(self):
+        """Custom tactics slots, loaded on first access"""
+        if self._custom_tactics is None:
+            self.load_custom_tactics()
+        return self._custom_tactics
     
     def get_available_tactics(self):
-        """Get list of all available tactics (prebuilt + custom)"""
+        """Get all available tactics (prebuilt + custom)
+        
+        Returns a tuple shared between calls until custom tactics change.
+        """
+        if self._available_cache is not None:
+            return self._available_cache
+        
         tactics_list = []
         
         # Add prebuilt tactics
@@ -95,7 +185,8 @@ class TacticsManager:
                     'type': 'empty_custom'
                 })
         
-        return tactics_list
+        self._available_cache = tuple(tactics_list)
+        return self._available_cache
     
     def mirror_positions_for_team2(self, team1_positions):
         """Mirror team1 positions to create team2 positions"""
@@ -106,37 +197,74 @@ class TacticsManager:
             team2_positions.append((mirrored_x, y))
         return team2_positions
 
+    def _invalidate_tactic_caches(self):
+        """Drop cached tactic data after custom tactics change"""
+        self._pos_cache.clear()
+        self._custom_mirrored.clear()
+        self._preview_layout_cache.clear()
+        self._available_cache = None
+        self._all_keys_cache = None
+    
+    def _mirrored_positions(self, tactic_key, tactic):
+        """Team 2 positions for a tactic with a 'positions' list, mirrored only once"""
+        mirrored = tactic.get('positions_mirrored')  # Precomputed for prebuilt tactics
+        if mirrored is None:
+            mirrored = self._custom_mirrored.get(tactic_key)
+            if mirrored is None:
+                mirrored = tuple(self.mirror_positions_for_team2(tactic['positions']))
+                self._custom_mirrored[tactic_key] = mirrored
+        return mirrored
+    
     def get_tactic_positions(self, tactic_key, team):
-        """Get player positions for a specific tactic and team"""
+        """Get player positions for a specific tactic and team
+        
+        Returns an immutable tuple of (x, y) tuples, shared between calls.
+        """
+        cache_key = (tactic_key, team)
+        cached = self._pos_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        positions = tuple((x, y) for x, y in self._compute_tactic_positions(tactic_key, team))
+        self._pos_cache[cache_key] = positions
+        return positions
+    
+    def _compute_tactic_positions(self, tactic_key, team):
+        """Resolve positions for a tactic and team (uncached)"""
         # Check prebuilt tactics first
-        if tactic_key in self.prebuilt_tactics:
-            tactic = self.prebuilt_tactics[tactic_key]
-            base_positions = tactic['positions']
+        tactic = self.prebuilt_tactics.get(tactic_key)
+        if tactic is not None:
             if team == 1:
-                return base_positions
+                return tactic['positions']
             else:
-                return self.mirror_positions_for_team2(base_positions)
+                return tactic['positions_mirrored']
         
         # Check custom tactics
-        if tactic_key in self.custom_tactics and self.custom_tactics[tactic_key] is not None:
-            tactic = self.custom_tactics[tactic_key]
-            if tactic is not None:  # Additional safety check
-                # For custom tactics, maintain old structure for now but check if they have 'positions' key
-                if 'positions' in tactic:
-                    base_positions = tactic['positions']
-                    if team == 1:
-                        return base_positions
-                    else:
-                        return self.mirror_positions_for_team2(base_positions)
+        tactic = self.custom_tactics.get(tactic_key)
+        if tactic is not None:
+            # For custom tactics, maintain old structure for now but check if they have 'positions' key
+            if 'positions' in tactic:
+                if team == 1:
+                    return tactic['positions']
+                else:
+                    return self._mirrored_positions(tactic_key, tactic)
+            else:
+                # Legacy custom tactics with team1_positions and team2_positions
+                if team == 1:
+                    return tactic.get('team1_positions', [])
                 else:
-                    # Legacy custom tactics with team1_positions and team2_positions
-                    if team == 1:
-                        return tactic['team1_positions'] if 'team1_positions' in tactic else []
-                    else:
-                        return tactic['team2_positions'] if 'team2_positions' in tactic else []
+                    return tactic.get('team2_positions', [])
         
         # Fallback to balanced formation
-        return self.get_tactic_positions('balanced', team)
+        return self._compute_tactic_positions('balanced', team)
+    
+    def _selectable_tactic_keys(self):
+        """Prebuilt keys followed by the keys of custom tactics that exist"""
+        if self._all_keys_cache is None:
+            self._all_keys_cache = self._prebuilt_keys + tuple(
+                key for key, tactic in self.custom_tactics.items() if tactic is not None
+            )
+        return self._all_keys_cache
     
     def select_random_tactic(self, exclude_custom=True, avoid_tactic=None):
         """Select a random tactic (used for bots)
@@ -145,21 +273,16 @@ class TacticsManager:
             exclude_custom: Whether to exclude custom tactics from selection
             avoid_tactic: Tactic key to avoid (for better bot variety)
         """
-        import random
-        
         if exclude_custom:
             # Only select from prebuilt tactics
-            tactics = list(self.prebuilt_tactics.keys())
+            tactics = self._prebuilt_keys
         else:
             # Include custom tactics that exist
-            tactics = list(self.prebuilt_tactics.keys())
-            for key, tactic in self.custom_tactics.items():
-                if tactic is not None:
-                    tactics.append(key)
+            tactics = self._selectable_tactic_keys()
         
         # Remove the tactic to avoid if specified and if there are other options
         if avoid_tactic and avoid_tactic in tactics and len(tactics) > 1:
-            tactics.remove(avoid_tactic)
+            tactics = tuple(key for key in tactics if key != avoid_tactic)
         
         return random.choice(tactics)
 
@@ -170,19 +293,14 @@ class TacticsManager:
             opponent_team_number: Team number of the opponent (1 or 2)
                                  If provided, will avoid their tactic for variety
         """
-        import random
-        
         # Get all available tactics (including custom ones)
-        tactics = list(self.prebuilt_tactics.keys())
-        for key, tactic in self.custom_tactics.items():
-            if tactic is not None:
-                tactics.append(key)
+        tactics = self._selectable_tactic_keys()
         
         # If opponent team specified, try to avoid their tactic for variety
         if opponent_team_number:
             opponent_tactic = self.get_team_tactic(opponent_team_number)
             if opponent_tactic in tactics and len(tactics) > 1:
-                tactics.remove(opponent_tactic)
+                tactics = tuple(key for key in tactics if key != opponent_tactic)
         
         return random.choice(tactics)
     
@@ -202,17 +320,19 @@ class TacticsManager:
     
     def is_custom_tactic(self, tactic_key):
         """Check if a tactic is a custom tactic"""
-        return tactic_key in ['custom1', 'custom2', 'custom3', 'custom4', 'custom5', 'custom6']
+        return tactic_key in _CUSTOM_SLOTS
     
     def create_custom_tactic(self, slot_key, name, positions):
         """Create a new custom tactic"""
-        if slot_key not in ['custom1', 'custom2', 'custom3', 'custom4', 'custom5', 'custom6']:
+        if slot_key not in _CUSTOM_SLOTS:
             return False
         
         self.custom_tactics[slot_key] = {
             'name': name,
             'positions': positions.copy()
         }
+        self._invalidate_tactic_caches()
+        self._mirrored_positions(slot_key, self.custom_tactics[slot_key])
         
         # Save to config manager for persistence
         set_custom_tactics(self.custom_tactics)
@@ -227,8 +347,9 @@ class TacticsManager:
     
     def reset_all_custom_tactics(self):
         """Clear all custom tactics and reset them to empty"""
-        for slot in ['custom1', 'custom2', 'custom3', 'custom4', 'custom5', 'custom6']:
+        for slot in sorted(_CUSTOM_SLOTS):
             self.custom_tactics[slot] = None
+        self._invalidate_tactic_caches()
         
         # Save changes to config for persistence
         self.save_custom_tactics_to_config()
@@ -236,14 +357,15 @@ class TacticsManager:
     
     def delete_custom_tactic(self, slot_key):
         """Delete a specific custom tactic"""
-        if slot_key not in ['custom1', 'custom2', 'custom3', 'custom4', 'custom5', 'custom6']:
+        if slot_key not in _CUSTOM_SLOTS:
             return False
         
-        if self.custom_tactics[slot_key] is None:
+        if self.custom_tactics.get(slot_key) is None:
             return False  # Already empty
         
         # Clear the slot
         self.custom_tactics[slot_key] = None
+        self._invalidate_tactic_caches()
         
         # Save changes to config for persistence
         self.save_custom_tactics_to_config()
@@ -252,19 +374,24 @@ class TacticsManager:
     def load_custom_tactics(self):
         """Load custom tactics from config manager"""
         # Ensure we have the latest data from config
-        self.custom_tactics = get_custom_tactics()
-        if not self.custom_tactics:
+        custom_tactics = get_custom_tactics()
+        if not custom_tactics:
             # Initialize with defaults if empty
-            self.custom_tactics = DEFAULT_CUSTOM_TACTICS.copy()
-            set_custom_tactics(self.custom_tactics)
+            custom_tactics = DEFAULT_CUSTOM_TACTICS.copy()
+            set_custom_tactics(custom_tactics)
         
         # Deep copy any non-None tactics to avoid reference issues
-        for key, tactic in self.custom_tactics.items():
+        for key, tactic in custom_tactics.items():
             if tactic is not None:
-                self.custom_tactics[key] = {
+                custom_tactics[key] = {
                     'name': tactic['name'],
                     'positions': tactic['positions'].copy()
                 }
+        self._custom_tactics = custom_tactics
+        self._invalidate_tactic_caches()
+        for key, tactic in custom_tactics.items():
+            if tactic is not None:
+                self._mirrored_positions(key, tactic)
     
     def validate_positions(self, positions):
         """Validate that positions are within field bounds and reasonable"""
@@ -313,40 +440,34 @@ class TacticsManager:
     
     def check_player_ball_conflicts(self, team1_positions, team2_positions):
         """Check if any player positions conflict with ball positions"""
-        ball_positions = self.get_ball_positions()
         conflicts = []
+        ball_zones = self._ball_zones
+        left, top, right, bottom = self._ball_zones_box
         
         all_positions = [(pos, 1, i+1) for i, pos in enumerate(team1_positions)] + \
                        [(pos, 2, i+1) for i, pos in enumerate(team2_positions)]
         
-        # Track which players have conflicts to avoid duplicates
-        conflicted_players = set()
-        
         for player_pos, team, player_num in all_positions:
             px, py = player_pos
-            player_key = (team, player_num)
             
-            # Skip if this player already has a conflict recorded
-            if player_key in conflicted_players:
+            # Broad phase: skip players clear of every ball zone's bounding box
+            if px < left or px > right or py < top or py > bottom:
                 continue
             
             # Check if this player conflicts with any ball zone
-            min_distance = float('inf')
+            min_distance_sq = float('inf')
             max_required_distance = 0
             player_has_conflict = False
             
-            for ball_info in ball_positions:
-                bx, by = ball_info['position']
-                warning_zone_radius = ball_info['radius']
+            for bx, by, required_distance, required_distance_sq in ball_zones:
+                dx = px - bx
+                dy = py - by
+                distance_sq = dx * dx + dy * dy
                 
-                # Calculate distance between player center and ball position center
-                distance_AB = math.sqrt((px - bx)**2 + (py - by)**2)
-                required_distance = PLAYER_RADIUS + warning_zone_radius
-                
-                # Check if Ra + Rb > AB (player radius + warning zone radius > distance between centers)
-                if required_distance > distance_AB:
+                # Ra + Rb > AB, compared squared (player radius + warning zone radius > distance)
+                if distance_sq < required_distance_sq:
                     player_has_conflict = True
-                    min_distance = min(min_distance, distance_AB)
+                    min_distance_sq = min(min_distance_sq, distance_sq)
                     max_required_distance = max(max_required_distance, required_distance)
             
             # If player has any conflicts, add one entry with the worst case
@@ -354,98 +475,131 @@ class TacticsManager:
                 conflicts.append({
                     'team': team,
                     'player': player_num,
-                    'distance': min_distance,
+                    'distance': math.sqrt(min_distance_sq),
                     'required_distance': max_required_distance
                 })
-                conflicted_players.add(player_key)
         
         return conflicts
     
+    def check_mirrored_ball_conflicts(self, team1_positions):
+        """Check ball conflicts for team 1 and its mirror image as team 2
+        
+        Same result as check_player_ball_conflicts(team1_positions,
+        mirror_positions_for_team2(team1_positions)), but with symmetric ball
+        zones team 2's conflicts are copied from team 1's instead of recomputed.
+        """
+        if not self._symmetric_ball_zones:
+            team2_positions = self.mirror_positions_for_team2(team1_positions)
+            return self.check_player_ball_conflicts(team1_positions, team2_positions)
+        
+        conflicts = self.check_player_ball_conflicts(team1_positions, ())
+        return conflicts + [dict(conflict, team=2) for conflict in conflicts]
     
-    def check_player_collisions(self, team1_positions, team2_positions):
-        """Check if any players are colliding with each other"""
+    
+    def _team_collisions(self, positions, team):
+        """Find overlapping player pairs within one team"""
         collisions = []
-        
-        # Check collisions within team 1
-        for i in range(len(team1_positions)):
-            for j in range(i + 1, len(team1_positions)):
-                pos1 = team1_positions[i]
-                pos2 = team1_positions[j]
-                distance = math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
-                total_radius = PLAYER_RADIUS + PLAYER_RADIUS  # Both players' radii
+        total_radius = PLAYER_RADIUS + PLAYER_RADIUS  # Both players' radii
+        total_radius_sq = total_radius * total_radius
+        count = len(positions)
+        
+        for i in range(count):
+            x1, y1 = positions[i]
+            for j in range(i + 1, count):
+                x2, y2 = positions[j]
+                dx = x1 - x2
                 
-                if distance < total_radius:
-                    collisions.append({
-                        'team': 1,
-                        'players': sorted([i + 1, j + 1]),  # 1-indexed and sorted
-                        'distance': distance,
-                        'required_distance': total_radius
-                    })
-        
-        # Check collisions within team 2
-        for i in range(len(team2_positions)):
-            for j in range(i + 1, len(team2_positions)):
-                pos1 = team2_positions[i]
-                pos2 = team2_positions[j]
-                distance = math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
-                total_radius = PLAYER_RADIUS + PLAYER_RADIUS
+                # Broad phase: players a full diameter apart on x cannot overlap
+                if dx >= total_radius or dx <= -total_radius:
+                    continue
                 
-                if distance < total_radius:
+                dy = y1 - y2
+                distance_sq = dx * dx + dy * dy
+                
+                # Compare squared distances; only take the root for actual collisions
+                if distance_sq < total_radius_sq:
                     collisions.append({
-                        'team': 2,
-                        'players': sorted([i + 1, j + 1]),  # 1-indexed and sorted
-                        'distance': distance,
+                        'team': team,
+                        'players': [i + 1, j + 1],  # 1-indexed, already ascending
+                        'distance': math.sqrt(distance_sq),
                         'required_distance': total_radius
                     })
         
         return collisions
     
+    def check_player_collisions(self, team1_positions, team2_positions):
+        """Check if any players are colliding with each other"""
+        return (self._team_collisions(team1_positions, 1) +
+                self._team_collisions(team2_positions, 2))
+    
+    def check_mirrored_player_collisions(self, team1_positions):
+        """Check player collisions for team 1 and its mirror image as team 2
+        
+        Mirroring preserves distances between teammates, so team 2's collisions
+        are copied from team 1's instead of mirroring and scanning again.
+        """
+        collisions = self._team_collisions(team1_positions, 1)
+        return collisions + [
+            dict(collision, team=2, players=list(collision['players'])) for collision in collisions
+        ]
+    
     def validate_tactic(self, tactic_key):
         """Validate a tactic according to editor rules"""
-        tactic = None
-        
-        if tactic_key in self.prebuilt_tactics:
-            tactic = self.prebuilt_tactics[tactic_key]
-        elif tactic_key in self.custom_tactics and self.custom_tactics[tactic_key] is not None:
-            tactic = self.custom_tactics[tactic_key]
+        tactic = self.prebuilt_tactics.get(tactic_key)
+        if tactic is None:
+            tactic = self.custom_tactics.get(tactic_key)
         
         if tactic is None:
             return False, ["Tactic not found"]
         
-        # Get positions for both teams
-        if 'positions' in tactic:
-            # New structure - generate team2 positions by mirroring
-            team1_pos = tactic['positions']
-            team2_pos = self.mirror_positions_for_team2(team1_pos)
+        if 'positions' in tactic and self._symmetric_ball_zones:
+            # New structure - team 2 is the mirror of team 1 about the center line.
+            # Mirroring preserves pair distances and field bounds, and the ball zones
+            # are symmetric about that line, so team 2 reports exactly the same
+            # errors as team 1: validate one team and count each error twice.
+            ball_errors, collision_errors, bounds_errors = self._validate_single_team(tactic['positions'], 1)
+            ball_errors *= 2
+            collision_errors *= 2
+            bounds_errors *= 2
         else:
-            # Legacy structure for custom tactics
-            team1_pos = tactic.get('team1_positions', [])
-            team2_pos = tactic.get('team2_positions', [])
-        
-        errors = []
-        
+            if 'positions' in tactic:
+                team1_positions = tactic['positions']
+                team2_positions = self._mirrored_positions(tactic_key, tactic)
+            else:
+                # Legacy structure for custom tactics - teams are independent
+                team1_positions = tactic.get('team1_positions', [])
+                team2_positions = tactic.get('team2_positions', [])
+            team1_errors = self._validate_single_team(team1_positions, 1)
+            team2_errors = self._validate_single_team(team2_positions, 2)
+            ball_errors, collision_errors, bounds_errors = (
+                e1 + e2 for e1, e2 in zip(team1_errors, team2_errors)
+            )
+        
+        errors = ball_errors + collision_errors + bounds_errors
+        return len(errors) == 0, errors
+    
+    def _validate_single_team(self, positions, team):
+        """Collect (ball conflict, collision, out of bounds) error lists for one team"""
         # Check ball conflicts
-        ball_conflicts = self.check_player_ball_conflicts(team1_pos, team2_pos)
-        if ball_conflicts:
-            for conflict in ball_conflicts:
-                errors.append(f"Player {conflict['player']} overlaps ball zone")
+        ball_errors = [
+            f"Player {conflict['player']} overlaps ball zone"
+            for conflict in self.check_player_ball_conflicts(positions, ())
+        ]
         
         # Check player collisions
-        player_collisions = self.check_player_collisions(team1_pos, team2_pos)
-        if player_collisions:
-            for collision in player_collisions:
-                players_str = ", ".join(map(str, collision['players']))
-                errors.append(f"Players {players_str} collision")
+        collision_errors = [
+            f"Players {', '.join(map(str, collision['players']))} collision"
+            for collision in self._team_collisions(positions, team)
+        ]
         
         # Check field bounds
-        for team, positions in [(1, team1_pos), (2, team2_pos)]:
-            for i, pos in enumerate(positions):
-                x, y = pos
-                if not (PLAYER_RADIUS <= x <= FIELD_WIDTH - PLAYER_RADIUS and 
-                       PLAYER_RADIUS <= y <= FIELD_HEIGHT - PLAYER_RADIUS):
-                    errors.append(f"Player {i+1} out of bounds")
+        bounds_errors = [
+            f"Player {i+1} out of bounds"
+            for i, (x, y) in enumerate(positions)
+            if not (_BOUNDS_MIN <= x <= _BOUNDS_MAX_X and _BOUNDS_MIN <= y <= _BOUNDS_MAX_Y)
+        ]
         
-        return len(errors) == 0, errors
+        return ball_errors, collision_errors, bounds_errors
     
     def validate_all_tactics(self):
         """Validate all prebuilt and custom tactics"""
@@ -486,6 +640,7 @@ class TacticsManager:
         
         # Save changes to config for persistence
         if removed_count > 0:
+            self._invalidate_tactic_caches()
             self.save_custom_tactics_to_config()
         
         return removed_count
@@ -505,10 +660,17 @@ class TacticsManager:
     def draw_formation_preview(self, screen, tactic_key, team, x, y, scale=0.9375):
         """Draw a formation preview showing half field rotated 90 degrees left"""
         positions = self.get_tactic_positions(tactic_key, team)
-        
-        # Preview dimensions (125% bigger than 0.75, showing half field)
-        preview_width = FIELD_HEIGHT * scale  # Width becomes height due to 90° rotation
-        preview_height = (FIELD_WIDTH // 2) * scale  # Height becomes half width
+        if self._preview_font is None:
+            self._preview_font = pygame.font.Font(None, 28)  # Bigger font for better visibility
+        if len(self._digit_surfs) < len(positions):
+            # Player numbers are rendered once; saved tactics may have extra players
+            self._digit_surfs += tuple(
+                self._preview_font.render(str(i + 1), True, MENU_TEXT_COLOR)
+                for i in range(len(self._digit_surfs), max(5, len(positions)))
+            )
+        
+        (preview_width, preview_height, goal_width, goal_depth,
+         goal_x_offset, player_radius) = self._preview_constants(scale)
         
         # Draw field background (rotated)
         field_rect = pygame.Rect(x, y, preview_width, preview_height)
@@ -536,24 +698,67 @@ class TacticsManager:
             pygame.draw.line(screen, WHITE, (center_line_x, y), (center_line_x, y + preview_height), 2)
         
         # Draw goal
-        goal_width = GOAL_WIDTH * scale
-        goal_depth = GOAL_DEPTH * scale
-        
         if show_left_goal:
             # Left goal (team 1's goal) - now at bottom due to rotation
-            goal_x = x + (preview_width - goal_width) // 2
+            goal_x = x + goal_x_offset
             goal_y = y + preview_height
             pygame.draw.rect(screen, WHITE, (goal_x, goal_y, goal_width, goal_depth), 2)
         else:
             # Right goal (team 2's goal) - now at bottom due to rotation  
-            goal_x = x + (preview_width - goal_width) // 2
+            goal_x = x + goal_x_offset
             goal_y = y - goal_depth
             pygame.draw.rect(screen, WHITE, (goal_x, goal_y, goal_width, goal_depth), 2)
         
         # Draw players with rotation and filtering
         team_color = TEAM1_COLOR if team == 1 else TEAM2_COLOR
-        player_radius = max(10, int(PLAYER_RADIUS * scale * 0.8))  # Slightly bigger for better visibility
         
+        for i, rotated_x, rotated_y in self._preview_layout(tactic_key, team, scale, positions, x_offset,
+                                                           preview_width, preview_height):
+            # Position in preview area
+            player_x = int(x + rotated_x)
+            player_y = int(y + rotated_y)
+            
+            pygame.draw.circle(screen, team_color, (player_x, player_y), player_radius)
+            pygame.draw.circle(screen, WHITE, (player_x, player_y), player_radius, 2)
+            
+            # Player number
+            text = self._digit_surfs[i]
+            text_rect = text.get_rect(center=(player_x, player_y))
+            screen.blit(text, text_rect)
+    
+    def _preview_constants(self, scale):
+        """Preview dimensions for a scale, cached since nearly every preview uses the default
+        
+        Returns (preview_width, preview_height, goal_width, goal_depth,
+        goal_x_offset, player_radius).
+        """
+        dims = self._preview_const_cache.get(scale)
+        if dims is None:
+            # Preview dimensions (125% bigger than 0.75, showing half field)
+            preview_width = FIELD_HEIGHT * scale  # Width becomes height due to 90° rotation
+            preview_height = (FIELD_WIDTH // 2) * scale  # Height becomes half width
+            goal_width = GOAL_WIDTH * scale
+            goal_depth = GOAL_DEPTH * scale
+            dims = (
+                preview_width, preview_height, goal_width, goal_depth,
+                (preview_width - goal_width) // 2,
+                max(10, int(PLAYER_RADIUS * scale * 0.8)),  # Slightly bigger for better visibility
+            )
+            self._preview_const_cache[scale] = dims
+        return dims
+    
+    def _preview_layout(self, tactic_key, team, scale, positions, x_offset, preview_width, preview_height):
+        """Rotated preview offsets (index, dx, dy) of the players shown in a formation preview
+        
+        Only depends on the tactic, team and scale, so it is computed once and
+        cached until custom tactics change.
+        """
+        cache_key = (tactic_key, team, scale)
+        layout = self._preview_layout_cache.get(cache_key)
+        if layout is not None:
+            return layout
+        
+        layout = []
         for i, pos in enumerate(positions):
             orig_x, orig_y = pos
             
@@ -568,25 +773,21 @@ class TacticsManager:
             rotated_x = (orig_y) * scale  # y becomes x
             rotated_y = ((FIELD_WIDTH // 2) - (orig_x - x_offset)) * scale  # x becomes y (flipped)
             
-            # Position in preview area
-            player_x = x + rotated_x
-            player_y = y + rotated_y
-            
             # Only draw if within preview bounds
-            if (x <= player_x <= x + preview_width and 
-                y <= player_y <= y + preview_height):
-                
-                pygame.draw.circle(screen, team_color, (int(player_x), int(player_y)), player_radius)
-                pygame.draw.circle(screen, WHITE, (int(player_x), int(player_y)), player_radius, 2)
-                
-                # Player number
-                font = pygame.font.Font(None, 28)  # Bigger font for better visibility
-                text = font.render(str(i + 1), True, MENU_TEXT_COLOR)
-                text_rect = text.get_rect(center=(int(player_x), int(player_y)))
-                screen.blit(text, text_rect)
+            if 0 <= rotated_x <= preview_width and 0 <= rotated_y <= preview_height:
+                layout.append((i, rotated_x, rotated_y))
+        
+        layout = tuple(layout)
+        self._preview_layout_cache[cache_key] = layout
+        return layout
 
 class CustomTacticsEditor:
     """Editor for creating custom tactics"""
+    # Pixels the pre-rendered field background extends past the field rect
+    _FIELD_BG_MARGIN = 2
+    # Violating players blink every 250ms
+    _BLINK_INTERVAL = 250
+    
     def __init__(self, tactics_manager):
         self.tactics_manager = tactics_manager
         self.editing_slot = None  # 'custom1' through 'custom6'
@@ -598,13 +799,31 @@ class CustomTacticsEditor:
         # Save/Reset button states
         self.save_button_rect = None
         self.reset_button_rect = None
+        self._save_text_rect = None
+        self._reset_text_rect = None
         self.save_button_hovered = False
         self.reset_button_hovered = False
         
+        # Rotated half-field layout on screen; set by set_field_layout on first draw
+        self.field_x = 0
+        self.field_y = 0
+        self.field_width = 0
+        self.field_height = 0
+        self.field_scale = 1.0
+        self.field_ready = False
+        # Screen position of each player in that layout (None outside team 1's
+        # half), kept in sync with self.positions
+        self._screen_positions = []
+        self._recompute_screen_positions()
+        
         # Track unsaved changes
         self.has_unsaved_changes = False
-        self.original_positions = []
         self.original_name = ""
+        # Bumped on every position edit; compared instead of copies of the positions
+        # (reset and drag end re-check against the saved tactic, see
+        # _settle_positions_version)
+        self._positions_version = 0
+        self._original_version = 0
         
         # Consolidated warning system
         self.show_consolidated_warning = False
@@ -617,6 +836,32 @@ class CustomTacticsEditor:
         
         # Player collision tracking
         self.player_collisions = []
+        
+        # Which players are in conflict, as compact tuples: the realtime checks
+        # compare these instead of the full conflict dicts
+        self._ball_conflicts_token = ()
+        self._player_collisions_token = ()
+        
+        # Set when positions change; draw() re-runs the realtime checks only then
+        self._positions_dirty = True
+        
+        # Set when something shown changed; the main loop skips idle repaints
+        # (see needs_redraw). Blink phase of the last drawn frame
+        self._needs_redraw = True
+        self._blink_white = None
+        
+        # Fonts by size, created on first use (see _font)
+        self._font_cache = {}
+        # Rendered static text surfaces by (text, size, color); see _text
+        self._text_cache = {}
+        # Semi-transparent ball warning zone surfaces by screen radius
+        self._warning_zone_cache = {}
+        # Pre-rendered field background for the current layout; see _build_field_background
+        self._field_background = None
+        # Rendered consolidated warning lines with their rects, for the violation
+        # tokens in _warning_lines_key
+        self._warning_lines_key = None
+        self._warning_surfaces = []
     
     def start_editing(self, slot_key):
         """Start editing a custom tactic slot"""
@@ -642,96 +887,158 @@ class CustomTacticsEditor:
             self.reset_to_default_positions()
             slot_number = slot_key[-1]
             self.tactic_name = f"Custom Tactics #{slot_number}"
+        self._recompute_screen_positions()
         
         # Store original state for unsaved changes detection
-        self.original_positions = self.positions.copy()
         self.original_name = self.tactic_name
+        self._original_version = self._positions_version
         
-        # Check for initial ball conflicts
-        self.check_realtime_ball_conflicts()
-        
-        # Check for initial player collisions
-        self.check_realtime_player_collisions()
+        # Check for initial ball conflicts and player collisions on the next draw
+        self._positions_dirty = True
+        self._needs_redraw = True
     
     def reset_to_default_positions(self):
         """Reset to default balanced formation"""
-        self.positions = [
-            (FIELD_WIDTH * 0.1, FIELD_HEIGHT * 0.5),   # Goalkeeper
-            (FIELD_WIDTH * 0.25, FIELD_HEIGHT * 0.25), # Defender 1
-            (FIELD_WIDTH * 0.25, FIELD_HEIGHT * 0.75), # Defender 2
-            (FIELD_WIDTH * 0.4, FIELD_HEIGHT * 0.35),  # Midfielder
-            (FIELD_WIDTH * 0.4, FIELD_HEIGHT * 0.65),  # Forward
-        ]
+        self.positions = list(_DEFAULT_CUSTOM_POSITIONS)
+        self._recompute_screen_positions()
         self.mark_unsaved_changes()
+        self._settle_positions_version()
         
-        # Check for ball conflicts after reset
-        self.check_realtime_ball_conflicts()
-        
-        # Check for player collisions after reset
-        self.check_realtime_player_collisions()
+        # Check for ball conflicts and player collisions after reset on the next draw
+        self._positions_dirty = True
     
     def mark_unsaved_changes(self):
         """Mark that there are unsaved changes"""
         self.has_unsaved_changes = True
+        self._positions_version += 1
+    
+    def _saved_positions(self):
+        """Positions of the slot as loaded or last saved (defaults for an empty slot)"""
+        tactic = self.tactics_manager.custom_tactics[self.editing_slot] if self.editing_slot else None
+        if tactic is not None:
+            if 'positions' in tactic:
+                return tactic['positions']
+            if 'team1_positions' in tactic:
+                return tactic['team1_positions']
+        return list(_DEFAULT_CUSTOM_POSITIONS)
+    
+    def _settle_positions_version(self):
+        """Treat positions that are back at their saved values as unchanged"""
+        if (self._positions_version != self._original_version and
+                self.positions == self._saved_positions()):
+            self._positions_version = self._original_version
     
     def check_unsaved_changes(self):
         """Check if there are unsaved changes"""
-        return (self.positions != self.original_positions or
+        return (self._positions_version != self._original_version or
                 self.tactic_name != self.original_name)
     
+    def set_field_layout(self, x, y, width, height, scale):
+        """Set where the rotated half field is drawn and enable field input"""
+        self.field_x = x
+        self.field_y = y
+        self.field_width = width
+        self.field_height = height
+        self.field_scale = scale
+        self.field_ready = True
+        self._field_background = None
+        self._recompute_screen_positions()
+    
+    def _to_screen(self, pos):
+        """Screen position of a field position in the rotated half-field view
+        
+        Returns None for positions outside team 1's half, which are not shown.
+        """
+        orig_x, orig_y = pos
+        if orig_x > FIELD_WIDTH // 2:
+            return None
+        
+        # 90 degree rotation: field y becomes screen x, field x becomes screen y (flipped)
+        rotated_x = orig_y
+        rotated_y = (FIELD_WIDTH // 2) - orig_x
+        return (self.field_x + rotated_x * self.field_scale,
+                self.field_y + rotated_y * self.field_scale)
+    
+    def _recompute_screen_positions(self):
+        """Refresh the cached screen positions after positions or layout change"""
+        self._screen_positions = [self._to_screen(pos) for pos in self.positions]
+    
     def handle_mouse_move(self, mouse_pos):
         """Handle mouse movement for button hover effects"""
+        hovered = (self.save_button_hovered, self.reset_button_hovered)
         if self.save_button_rect:
             self.save_button_hovered = self.save_button_rect.collidepoint(mouse_pos)
         if self.reset_button_rect:
             self.reset_button_hovered = self.reset_button_rect.collidepoint(mouse_pos)
+        if hovered != (self.save_button_hovered, self.reset_button_hovered):
+            self._needs_redraw = True
+    
+    def request_redraw(self):
+        """Repaint the editor on the next frame"""
+        self._needs_redraw = True
+    
+    def needs_redraw(self, now=None):
+        """Whether the next frame would differ from the last one drawn
+        
+        Args:
+            now: Current pygame ticks, if the caller already has them
+        """
+        if self._needs_redraw or self._positions_dirty:
+            return True
+        
+        has_violations = bool(self.ball_conflicts or self.player_collisions)
+        if self.show_consolidated_warning and not has_violations:
+            # Warning is fading out (or about to be dismissed)
+            return True
+        if has_violations:
+            # Violating players blink; repaint only when the phase flips
+            if now is None:
+                now = pygame.time.get_ticks()
+            return ((now // self._BLINK_INTERVAL) % 2 == 0) != self._blink_white
+        return False
     
     def handle_mouse_click(self, mouse_pos):
         """Handle mouse click in editor"""
         # Check button clicks first
-        if hasattr(self, 'save_button_rect') and self.save_button_rect and self.save_button_rect.collidepoint(mouse_pos):
+        if self.save_button_rect and self.save_button_rect.collidepoint(mouse_pos):
             return self.save_tactic()
         
-        if hasattr(self, 'reset_button_rect') and self.reset_button_rect and self.reset_button_rect.collidepoint(mouse_pos):
+        if self.reset_button_rect and self.reset_button_rect.collidepoint(mouse_pos):
             self.reset_to_default_positions()
             return True
         
         mx, my = mouse_pos
         
         # Check if click is within field area
-        if (hasattr(self, 'field_x') and hasattr(self, 'field_y') and hasattr(self, 'field_width') and hasattr(self, 'field_height') and
+        if (self.field_ready and
             self.field_x <= mx <= self.field_x + self.field_width and 
             self.field_y <= my <= self.field_y + self.field_height):
             
-            # Check if clicking on a player
-            for i, pos in enumerate(self.positions):
-                orig_x, orig_y = pos
-                
+            # Check if clicking on a player (squared distances, first hit wins)
+            player_radius = max(8, int(PLAYER_RADIUS * self.field_scale * 0.8))
+            hit_distance_sq = (player_radius + 5) ** 2  # Small tolerance for easier clicking
+            
+            for i, screen_pos in enumerate(self._screen_positions):
                 # Skip players not in team1's half (only edit team1 positions)
-                if orig_x > FIELD_WIDTH // 2:
+                if screen_pos is None:
                     continue
                 
-                # Transform to screen coordinates
-                rotated_x = orig_y
-                rotated_y = (FIELD_WIDTH // 2) - orig_x
-                
-                screen_x = self.field_x + rotated_x * self.field_scale
-                screen_y = self.field_y + rotated_y * self.field_scale
-                
                 # Check distance to mouse click
-                distance = math.sqrt((mx - screen_x)**2 + (my - screen_y)**2)
-                player_radius = max(8, int(PLAYER_RADIUS * self.field_scale * 0.8))
+                screen_x, screen_y = screen_pos
+                dx = mx - screen_x
+                dy = my - screen_y
                 
-                if distance <= player_radius + 5:  # Small tolerance for easier clicking
+                if dx * dx + dy * dy <= hit_distance_sq:
                     self.selected_player = i
                     self.dragging = True
+                    self._needs_redraw = True
                     return True
         
         return False
     
     def handle_mouse_drag(self, mouse_pos):
         """Handle mouse drag in editor"""
-        if not self.dragging or not hasattr(self, 'field_scale'):
+        if not self.dragging or not self.field_ready:
             return
         
         mx, my = mouse_pos
@@ -745,22 +1052,34 @@ class CustomTacticsEditor:
         orig_y = field_mx
         
         # Clamp to team 1's half and field bounds
-        orig_x = max(PLAYER_RADIUS, min(FIELD_WIDTH // 2 - PLAYER_RADIUS, orig_x))
-        orig_y = max(PLAYER_RADIUS, min(FIELD_HEIGHT - PLAYER_RADIUS, orig_y))
+        if orig_x >= _DRAG_MAX_X:
+            orig_x = _DRAG_MAX_X
+        elif orig_x <= _BOUNDS_MIN:
+            orig_x = _BOUNDS_MIN
+        if orig_y >= _BOUNDS_MAX_Y:
+            orig_y = _BOUNDS_MAX_Y
+        elif orig_y <= _BOUNDS_MIN:
+            orig_y = _BOUNDS_MIN
+        new_pos = (orig_x, orig_y)
+        
+        # Nothing to do if the player did not actually move
+        if self.positions[self.selected_player] == new_pos:
+            return
         
         # Update player position
-        self.positions[self.selected_player] = (orig_x, orig_y)
+        self.positions[self.selected_player] = new_pos
+        self._screen_positions[self.selected_player] = self._to_screen(new_pos)
         
         self.mark_unsaved_changes()
         
-        # Check for ball conflicts in real-time
-        self.check_realtime_ball_conflicts()
-        
-        # Check for player collisions in real-time
-        self.check_realtime_player_collisions()
+        # Check for ball conflicts and player collisions on the next draw, once
+        # per frame however many drag events arrive
+        self._positions_dirty = True
     
     def handle_mouse_release(self):
         """Handle mouse release in editor"""
+        if self.dragging:
+            self._settle_positions_version()
         self.dragging = False
     
     def dismiss_consolidated_warning(self):
@@ -769,8 +1088,12 @@ class CustomTacticsEditor:
         self.consolidated_warning_start_time = 0
         self.consolidated_warning_fade_alpha = 255
     
-    def update_consolidated_warning(self):
-        """Update consolidated warning fade and auto-dismiss"""
+    def update_consolidated_warning(self, now=None):
+        """Update consolidated warning fade and auto-dismiss
+        
+        Args:
+            now: Current pygame ticks, if the caller already has them
+        """
         if not self.show_consolidated_warning:
             return
         
@@ -780,7 +1103,7 @@ class CustomTacticsEditor:
         
         if not has_ball_conflicts and not has_player_collisions:
             # No violations - start fading
-            current_time = pygame.time.get_ticks()
+            current_time = now if now is not None else pygame.time.get_ticks()
             elapsed = current_time - self.consolidated_warning_start_time
             
             if elapsed >= self.consolidated_warning_duration:
@@ -791,64 +1114,52 @@ class CustomTacticsEditor:
                 fade_progress = elapsed / self.consolidated_warning_duration
                 self.consolidated_warning_fade_alpha = max(0, int(255 * (1.0 - fade_progress)))
         else:
-            # Violations still exist - keep warning fully visible
+            # Violations still exist - keep warning fully visible. The start time
+            # is left alone: the realtime checks dismiss the warning as soon as
+            # the violations clear, so it never fades from a stale timestamp.
             self.consolidated_warning_fade_alpha = 255
-            # Update the warning start time to prevent premature fading
-            self.consolidated_warning_start_time = pygame.time.get_ticks()
     
-    def check_realtime_ball_conflicts(self):
-        """Check for ball conflicts in real-time and trigger warnings"""
-        # Generate team2 positions by mirroring team1 positions
-        team2_positions = self.tactics_manager.mirror_positions_for_team2(self.positions)
-        
-        # Get current ball conflicts
-        current_conflicts = self.tactics_manager.check_player_ball_conflicts(
-            self.positions, team2_positions
-        )
-        
-        # Check if conflicts have changed
-        conflicts_changed = (
-            len(current_conflicts) != len(self.ball_conflicts) or
-            any(c1 != c2 for c1, c2 in zip(current_conflicts, self.ball_conflicts))
-        )
+    @staticmethod
+    def _conflicts_token(conflicts):
+        """(team, player) of each ball conflict, in order"""
+        return tuple((conflict['team'], conflict['player']) for conflict in conflicts)
+    
+    @staticmethod
+    def _collisions_token(collisions):
+        """(team, players) of each player collision, in order"""
+        return tuple((collision['team'], tuple(collision['players'])) for collision in collisions)
+    
+    def check_realtime_violations(self, now=None):
+        """Check for ball conflicts and player collisions in real-time and trigger warnings
         
-        # Update conflicts list
-        self.ball_conflicts = current_conflicts
+        Args:
+            now: Current pygame ticks, if the caller already has them
+        """
+        manager = self.tactics_manager
         
-        # Trigger consolidated warning if needed
-        if (current_conflicts or self.player_collisions) and (not self.show_consolidated_warning or conflicts_changed):
-            self.show_consolidated_warning = True
-            self.consolidated_warning_start_time = pygame.time.get_ticks()
-            self.consolidated_warning_fade_alpha = 255
-        elif not current_conflicts and not self.player_collisions and self.show_consolidated_warning:
-            # No violations - dismiss warning
-            self.dismiss_consolidated_warning()
-    
-    def check_realtime_player_collisions(self):
-        """Check for player collisions in real-time and trigger warnings"""
-        # Generate team2 positions by mirroring team1 positions
-        team2_positions = self.tactics_manager.mirror_positions_for_team2(self.positions)
-        
-        # Get current collisions for all players
-        current_collisions = self.tactics_manager.check_player_collisions(
-            self.positions, team2_positions
-        )
+        # Get current ball conflicts and collisions (team2 mirrors team1 positions)
+        current_conflicts = manager.check_mirrored_ball_conflicts(self.positions)
+        current_collisions = manager.check_mirrored_player_collisions(self.positions)
         
-        # Check if collisions have changed
-        collisions_changed = (
-            len(current_collisions) != len(self.player_collisions) or
-            any(c1 != c2 for c1, c2 in zip(current_collisions, self.player_collisions))
-        )
+        # Check if the conflicting players or colliding pairs have changed
+        conflicts_token = self._conflicts_token(current_conflicts)
+        collisions_token = self._collisions_token(current_collisions)
+        violations_changed = (conflicts_token != self._ball_conflicts_token or
+                              collisions_token != self._player_collisions_token)
         
-        # Update collisions list
+        # Update violation lists
+        self.ball_conflicts = current_conflicts
         self.player_collisions = current_collisions
+        self._ball_conflicts_token = conflicts_token
+        self._player_collisions_token = collisions_token
         
         # Trigger consolidated warning if needed
-        if (current_collisions or self.ball_conflicts) and (not self.show_consolidated_warning or collisions_changed):
+        has_violations = bool(current_conflicts or current_collisions)
+        if has_violations and (not self.show_consolidated_warning or violations_changed):
             self.show_consolidated_warning = True
-            self.consolidated_warning_start_time = pygame.time.get_ticks()
+            self.consolidated_warning_start_time = now if now is not None else pygame.time.get_ticks()
             self.consolidated_warning_fade_alpha = 255
-        elif not current_collisions and not self.ball_conflicts and self.show_consolidated_warning:
+        elif not has_violations and self.show_consolidated_warning:
             # No violations - dismiss warning
             self.dismiss_consolidated_warning()
 
@@ -857,30 +1168,25 @@ class CustomTacticsEditor:
         if not self.editing_slot or not self.tactic_name.strip():
             return False
         
-        # Generate team2 positions by mirroring team1 positions
-        team2_positions = self.tactics_manager.mirror_positions_for_team2(self.positions)
-        
-        # Check for player collisions
-        collisions = self.tactics_manager.check_player_collisions(
-            self.positions, team2_positions
-        )
+        # Check for player collisions (team2 mirrors team1 positions)
+        collisions = self.tactics_manager.check_mirrored_player_collisions(self.positions)
         
         if collisions:
             # Store collisions and show warning
             self.player_collisions = collisions
+            self._player_collisions_token = self._collisions_token(collisions)
             self.show_consolidated_warning = True
             self.consolidated_warning_start_time = pygame.time.get_ticks()
             self.consolidated_warning_fade_alpha = 255
             return False
         
         # Check for ball position conflicts
-        conflicts = self.tactics_manager.check_player_ball_conflicts(
-            self.positions, team2_positions
-        )
+        conflicts = self.tactics_manager.check_mirrored_ball_conflicts(self.positions)
         
         if conflicts:
             # Store conflicts and show warning with timestamp
             self.ball_conflicts = conflicts
+            self._ball_conflicts_token = self._conflicts_token(conflicts)
             self.show_consolidated_warning = True
             self.consolidated_warning_start_time = pygame.time.get_ticks()
             self.consolidated_warning_fade_alpha = 255
@@ -895,137 +1201,193 @@ class CustomTacticsEditor:
         
         if success:
             # Update original state to current state
-            self.original_positions = self.positions.copy()
             self.original_name = self.tactic_name
+            self._original_version = self._positions_version
             self.has_unsaved_changes = False
             self.show_consolidated_warning = False
             self.ball_conflicts = []
             self.player_collisions = []
+            self._ball_conflicts_token = ()
+            self._player_collisions_token = ()
         
         return success
     
-    def draw(self, screen):
-        """Draw the custom tactics editor"""
-        # Check for real-time ball conflicts
-        self.check_realtime_ball_conflicts()
-        
-        # Check for real-time player collisions
-        self.check_realtime_player_collisions()
-        
-        # Update consolidated warning state
-        self.update_consolidated_warning()
-        
-        # Don't clear screen - background is handled by game manager
-        # The game manager draws the background and gradient overlay before calling this
-        
-        # Draw instructions
-        font = pygame.font.Font(None, 36)
-        small_font = pygame.font.Font(None, 24)
-        slot_name = self.editing_slot.capitalize() if self.editing_slot else "Unknown"
-        
-        # Unsaved changes indicator
-        if self.check_unsaved_changes():
-            changes_text = small_font.render("Unsaved changes", True, YELLOW)
-            screen.blit(changes_text, (10, 75))
-        
-        # Draw field background (rotated half-field view)
-        # Calculate dimensions for rotated half field
-        half_field_width = FIELD_WIDTH // 2
-        half_field_height = FIELD_HEIGHT
-        
-        # After 90-degree left rotation: width becomes height, height becomes width
-        rotated_width = half_field_height
-        rotated_height = half_field_width
-        
-        # Scale to fit window with margins
-        margin = 100
-        max_width = SCREEN_WIDTH - margin * 2
-        max_height = SCREEN_HEIGHT - 200  # Leave space for UI elements
-        
-        scale_x = max_width / rotated_width
-        scale_y = max_height / rotated_height
-        self.field_scale = min(scale_x, scale_y, 1.5)  # Cap at 1.5x for readability
+    def _font(self, size):
+        """Default font at the given size, created once and reused across frames"""
+        font = self._font_cache.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self._font_cache[size] = font
+        return font
+    
+    def _text(self, text, size, color):
+        """Rendered text surface, rasterized once per (text, size, color)"""
+        key = (text, size, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self._font(size).render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+    
+    def _build_field_background(self):
+        """Render the half field with stripes and markings for the current layout
         
-        # Calculate field dimensions and position
-        self.field_width = int(rotated_width * self.field_scale)
-        self.field_height = int(rotated_height * self.field_scale)
-        self.field_x = (SCREEN_WIDTH - self.field_width) // 2
-        self.field_y = 150  # Below UI text
+        The surface is transparent outside the drawn area and extends
+        _FIELD_BG_MARGIN pixels past the field (plus the goal posts below it),
+        since the thick lines are drawn across the field edges.
+        """
+        margin = self._FIELD_BG_MARGIN
+        goal_post_depth = int(GOAL_DEPTH * self.field_scale)
+        surface = pygame.Surface((self.field_width + margin * 2,
+                                  self.field_height + goal_post_depth + margin * 2), pygame.SRCALPHA)
+        x = y = margin
         
-        # Draw field background
-        field_rect = pygame.Rect(self.field_x, self.field_y, self.field_width, self.field_height)
-        pygame.draw.rect(screen, GREEN, field_rect)
+        # Field background
+        field_rect = pygame.Rect(x, y, self.field_width, self.field_height)
+        pygame.draw.rect(surface, GREEN, field_rect)
         
         # Draw grass stripes (rotated)
         stripe_count = 8
         stripe_height = self.field_height // stripe_count
         for i in range(stripe_count):
             if i % 2 == 0:
-                stripe_rect = pygame.Rect(self.field_x, self.field_y + i * stripe_height, self.field_width, stripe_height)
-                pygame.draw.rect(screen, (30, 180, 30), stripe_rect)
+                stripe_rect = pygame.Rect(x, y + i * stripe_height, self.field_width, stripe_height)
+                pygame.draw.rect(surface, GRASS_STRIPE_COLOR, stripe_rect)
         
         # Border
-        pygame.draw.rect(screen, WHITE, field_rect, 3)
+        pygame.draw.rect(surface, WHITE, field_rect, 3)
         
         # Draw field markings for team 1's half (only team we edit)
         # Team 1's half (left side) - goal at bottom after rotation
         # Center line at top
-        pygame.draw.line(screen, WHITE, (self.field_x, self.field_y), (self.field_x + self.field_width, self.field_y), 3)
+        pygame.draw.line(surface, WHITE, (x, y), (x + self.field_width, y), 3)
         
         # Goal area at bottom
         goal_area_width = int(200 * self.field_scale)  # Original penalty area width
         goal_area_height = int(100 * self.field_scale)  # Original goal area width becomes height
-        goal_x = self.field_x + (self.field_width - goal_area_width) // 2
-        goal_y = self.field_y + self.field_height - goal_area_height
-        pygame.draw.rect(screen, WHITE, (goal_x, goal_y, goal_area_width, goal_area_height), 3)
+        goal_x = x + (self.field_width - goal_area_width) // 2
+        goal_y = y + self.field_height - goal_area_height
+        pygame.draw.rect(surface, WHITE, (goal_x, goal_y, goal_area_width, goal_area_height), 3)
         
         # Penalty area
         penalty_area_width = int(320 * self.field_scale)  # Original penalty area height
         penalty_area_height = int(200 * self.field_scale)  # Original penalty area width
-        penalty_x = self.field_x + (self.field_width - penalty_area_width) // 2
-        penalty_y = self.field_y + self.field_height - penalty_area_height
-        pygame.draw.rect(screen, WHITE, (penalty_x, penalty_y, penalty_area_width, penalty_area_height), 3)
+        penalty_x = x + (self.field_width - penalty_area_width) // 2
+        penalty_y = y + self.field_height - penalty_area_height
+        pygame.draw.rect(surface, WHITE, (penalty_x, penalty_y, penalty_area_width, penalty_area_height), 3)
         
         # Goal posts
         goal_post_width = int(GOAL_WIDTH * self.field_scale)
-        goal_post_depth = int(GOAL_DEPTH * self.field_scale)
-        goal_post_x = self.field_x + (self.field_width - goal_post_width) // 2
-        goal_post_y = self.field_y + self.field_height
-        pygame.draw.rect(screen, WHITE, (goal_post_x, goal_post_y, goal_post_width, goal_post_depth), 3)
+        goal_post_x = x + (self.field_width - goal_post_width) // 2
+        goal_post_y = y + self.field_height
+        pygame.draw.rect(surface, WHITE, (goal_post_x, goal_post_y, goal_post_width, goal_post_depth), 3)
+        
+        return surface
+    
+    def _layout_buttons(self):
+        """Place the Save and Reset buttons and their captions below the field"""
+        button_y = FIELD_Y + FIELD_HEIGHT + 20
+        button_width = 100
+        button_height = 40
+        button_gap = 20
+        
+        save_x = FIELD_X + (FIELD_WIDTH - (button_width * 2 + button_gap)) // 2
+        self.save_button_rect = pygame.Rect(save_x, button_y, button_width, button_height)
+        self._save_text_rect = self._text("Save (S)", 24, MENU_TEXT_COLOR).get_rect(
+            center=self.save_button_rect.center)
+        
+        reset_x = save_x + button_width + button_gap
+        self.reset_button_rect = pygame.Rect(reset_x, button_y, button_width, button_height)
+        self._reset_text_rect = self._text("Reset (R)", 24, MENU_TEXT_COLOR).get_rect(
+            center=self.reset_button_rect.center)
+    
+    def draw(self, screen):
+        """Draw the custom tactics editor"""
+        # One timestamp for the whole frame (warning timing and blinking)
+        now = pygame.time.get_ticks()
+        self._needs_redraw = False
+        
+        if self._positions_dirty:
+            # Check for real-time ball conflicts and player collisions
+            self.check_realtime_violations(now)
+            self._positions_dirty = False
+        
+        # Update consolidated warning state
+        self.update_consolidated_warning(now)
+        
+        # Don't clear screen - background is handled by game manager
+        # The game manager draws the background and gradient overlay before calling this
+        
+        # Draw instructions
+        slot_name = self.editing_slot.capitalize() if self.editing_slot else "Unknown"
+        
+        # Unsaved changes indicator
+        if self.check_unsaved_changes():
+            changes_text = self._text("Unsaved changes", 24, YELLOW)
+            screen.blit(changes_text, (10, 75))
+        
+        # Draw field background (rotated half-field view)
+        if not self.field_ready:
+            # Calculate dimensions for rotated half field (screen constants only,
+            # so the layout is computed once)
+            half_field_width = FIELD_WIDTH // 2
+            half_field_height = FIELD_HEIGHT
+            
+            # After 90-degree left rotation: width becomes height, height becomes width
+            rotated_width = half_field_height
+            rotated_height = half_field_width
+            
+            # Scale to fit window with margins
+            margin = 100
+            max_width = SCREEN_WIDTH - margin * 2
+            max_height = SCREEN_HEIGHT - 200  # Leave space for UI elements
+            
+            scale_x = max_width / rotated_width
+            scale_y = max_height / rotated_height
+            field_scale = min(scale_x, scale_y, 1.5)  # Cap at 1.5x for readability
+            
+            # Calculate field dimensions and position
+            field_width = int(rotated_width * field_scale)
+            field_height = int(rotated_height * field_scale)
+            self.set_field_layout((SCREEN_WIDTH - field_width) // 2, 150,  # Below UI text
+                                  field_width, field_height, field_scale)
+        
+        # Draw field background, stripes and markings (pre-rendered per layout)
+        if self._field_background is None:
+            self._field_background = self._build_field_background()
+        screen.blit(self._field_background, (self.field_x - self._FIELD_BG_MARGIN, self.field_y - self._FIELD_BG_MARGIN))
         
         # Draw players (always team 1 colors since we only edit team 1)
-        current_time = pygame.time.get_ticks()
-        blink_interval = 250  # Blink every 250ms
-        is_blink_white = (current_time // blink_interval) % 2 == 0
+        is_blink_white = (now // self._BLINK_INTERVAL) % 2 == 0
+        self._blink_white = is_blink_white
         
         team_color = TEAM1_COLOR
         
-        for i, pos in enumerate(self.positions):
-            orig_x, orig_y = pos
-            
+        # Team 1 players with violations, looked up per player below
+        ball_conflict_players = {c['player'] for c in self.ball_conflicts if c['team'] == 1}
+        collision_players = set()
+        for coll in self.player_collisions:
+            if coll['team'] == 1:
+                collision_players.update(coll['players'])
+        
+        for i, screen_pos in enumerate(self._screen_positions):
             # Only show players in team 1's half (left half)
-            if orig_x > FIELD_WIDTH // 2:
+            if screen_pos is None:
                 continue
-                
-            # Transform coordinates to rotated half-field view
-            rotated_x = orig_y
-            rotated_y = (FIELD_WIDTH // 2) - orig_x
             
-            # Scale and position on screen
-            screen_x = self.field_x + rotated_x * self.field_scale
-            screen_y = self.field_y + rotated_y * self.field_scale
+            screen_x, screen_y = screen_pos
             
             # Check if this player has violations
-            has_ball_conflict = any(c['team'] == 1 and c['player'] == i+1 for c in self.ball_conflicts)
-            has_player_collision = any(1 == coll['team'] and i+1 in coll['players'] for coll in self.player_collisions)
+            has_ball_conflict = (i + 1) in ball_conflict_players
+            has_player_collision = (i + 1) in collision_players
             
             # Determine player color with blinking effect
             is_selected = (i == self.selected_player)
             if (has_ball_conflict or has_player_collision) and self.show_consolidated_warning:
                 if has_player_collision:
                     # Player collision: blink between orange and white
-                    color = (255, 165, 0) if is_blink_white else WHITE  # Orange
-                    border_color = WHITE if is_blink_white else (255, 165, 0)
+                    color = ORANGE if is_blink_white else WHITE
+                    border_color = WHITE if is_blink_white else ORANGE
                 else:
                     # Ball conflict: blink between black and white
                     color = WHITE if is_blink_white else BLACK
@@ -1044,8 +1406,7 @@ class CustomTacticsEditor:
             
             # Player number
             font_size = max(20, int(24 * self.field_scale))
-            number_font = pygame.font.Font(None, font_size)
-            text = number_font.render(str(i + 1), True, MENU_TEXT_COLOR)
+            text = self._text(str(i + 1), font_size, MENU_TEXT_COLOR)
             text_rect = text.get_rect(center=(int(screen_x), int(screen_y)))
             screen.blit(text, text_rect)
         
@@ -1069,8 +1430,11 @@ class CustomTacticsEditor:
             
             # Draw warning zone (semi-transparent)
             if warning_zone_radius > 5:  # Only draw if visible
-                warning_zone_surface = pygame.Surface((warning_zone_radius * 2, warning_zone_radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(warning_zone_surface, (255, 255, 0, 60), (int(warning_zone_radius), int(warning_zone_radius)), int(warning_zone_radius))
+                warning_zone_surface = self._warning_zone_cache.get(warning_zone_radius)
+                if warning_zone_surface is None:
+                    warning_zone_surface = pygame.Surface((warning_zone_radius * 2, warning_zone_radius * 2), pygame.SRCALPHA)
+                    pygame.draw.circle(warning_zone_surface, EDITOR_BALL_ZONE_COLOR, (int(warning_zone_radius), int(warning_zone_radius)), int(warning_zone_radius))
+                    self._warning_zone_cache[warning_zone_radius] = warning_zone_surface
                 screen.blit(warning_zone_surface, (ball_screen_x - warning_zone_radius, ball_screen_y - warning_zone_radius))
             
             # Draw ball position
@@ -1080,64 +1444,39 @@ class CustomTacticsEditor:
             
             # Ball label
             label_font_size = max(16, int(20 * self.field_scale))
-            ball_font = pygame.font.Font(None, label_font_size)
-            ball_text = ball_font.render("BALL", True, MENU_TEXT_COLOR)
+            ball_text = self._text("BALL", label_font_size, MENU_TEXT_COLOR)
             ball_text_rect = ball_text.get_rect(center=(int(ball_screen_x), int(ball_screen_y - 25 * self.field_scale)))
             screen.blit(ball_text, ball_text_rect)
         
-        # Draw Save and Reset buttons
-        button_y = FIELD_Y + FIELD_HEIGHT + 20
-        button_width = 100
-        button_height = 40
-        button_gap = 20
+        # Draw Save and Reset buttons (fixed layout, built on the first draw)
+        if self.save_button_rect is None:
+            self._layout_buttons()
         
         # Save button
-        save_x = FIELD_X + (FIELD_WIDTH - (button_width * 2 + button_gap)) // 2
-        self.save_button_rect = pygame.Rect(save_x, button_y, button_width, button_height)
-        save_color = (100, 150, 100) if self.save_button_hovered else (60, 120, 60)
+        save_color = EDITOR_SAVE_BUTTON_HOVER_COLOR if self.save_button_hovered else EDITOR_SAVE_BUTTON_COLOR
         pygame.draw.rect(screen, save_color, self.save_button_rect)
         pygame.draw.rect(screen, WHITE, self.save_button_rect, 2)
-        
-        save_text = small_font.render("Save (S)", True, MENU_TEXT_COLOR)
-        save_text_rect = save_text.get_rect(center=self.save_button_rect.center)
-        screen.blit(save_text, save_text_rect)
+        screen.blit(self._text("Save (S)", 24, MENU_TEXT_COLOR), self._save_text_rect)
         
         # Reset button
-        reset_x = save_x + button_width + button_gap
-        self.reset_button_rect = pygame.Rect(reset_x, button_y, button_width, button_height)
-        reset_color = (150, 100, 100) if self.reset_button_hovered else (120, 60, 60)
+        reset_color = EDITOR_RESET_BUTTON_HOVER_COLOR if self.reset_button_hovered else EDITOR_RESET_BUTTON_COLOR
         pygame.draw.rect(screen, reset_color, self.reset_button_rect)
         pygame.draw.rect(screen, WHITE, self.reset_button_rect, 2)
-        
-        reset_text = small_font.render("Reset (R)", True, MENU_TEXT_COLOR)
-        reset_text_rect = reset_text.get_rect(center=self.reset_button_rect.center)
-        screen.blit(reset_text, reset_text_rect)
+        screen.blit(self._text("Reset (R)", 24, MENU_TEXT_COLOR), self._reset_text_rect)
         
         # Instructions
-        instructions = [
-            "Click and drag players to position them",
-            "Press T to switch between teams",
-            "Click buttons or use keyboard shortcuts",
-            "ESC to exit (prompts if unsaved changes)",
-            "Yellow zones show ball positions - keep players clear!"
-        ]
-        
-        y_offset = button_y + button_height + 20
-        for instruction in instructions:
-            inst_text = small_font.render(instruction, True, MENU_TEXT_COLOR)
+        y_offset = self.reset_button_rect.bottom + 20
+        for instruction in _EDITOR_INSTRUCTIONS:
+            inst_text = self._text(instruction, 24, MENU_TEXT_COLOR)
             screen.blit(inst_text, (10, y_offset))
             y_offset += 25
         
-        # Draw consolidated warning text if needed
-        if self.show_consolidated_warning:
+        # Draw consolidated warning text if needed (skipped once fully faded)
+        if self.show_consolidated_warning and self.consolidated_warning_fade_alpha > 0:
             self.draw_consolidated_warning_text(screen)
     
-    def draw_consolidated_warning_text(self, screen):
-        """Draw consolidated warning as fading text with list of issues"""
-        if self.consolidated_warning_fade_alpha <= 0:
-            return
-        
-        # Build consolidated warning message
+    def _warning_lines(self):
+        """Lines of the consolidated warning for the current violations"""
         warning_lines = ["Cannot save:"]
         
         # Add ball conflicts (group by editing team)
@@ -1161,31 +1500,43 @@ class CustomTacticsEditor:
                 collision_players.update(collision['players'])
         
         if collision_players:
-            collision_list = sorted(list(collision_players))  # Ascending order
+            collision_list = sorted(collision_players)  # Ascending order
             if len(collision_list) == 1:
                 warning_lines.append(f"Player {collision_list[0]} conflicted in position")
             else:
                 players_str = ", ".join(map(str, collision_list))
                 warning_lines.append(f"Players {players_str} conflicted in their position")
         
-        warning_y = SCREEN_HEIGHT // 2 - int(SCREEN_HEIGHT * 0.40)
-        
-        # Font size reduced by 20% (from 48 to 38)
-        font_size = int(25)
-        font = pygame.font.Font(None, font_size)
-        
-        # Draw each line
-        line_height = font_size + 5
-        total_height = len(warning_lines) * line_height
-        start_y = warning_y - total_height // 2
+        return warning_lines
+    
+    def draw_consolidated_warning_text(self, screen):
+        """Draw consolidated warning as fading text with list of issues"""
+        if self.consolidated_warning_fade_alpha <= 0:
+            return
         
-        for i, line in enumerate(warning_lines):
-            # Create text with current alpha
-            text_surface = font.render(line, True, RED)
-            faded_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-            faded_surface.fill((255, 255, 255, self.consolidated_warning_fade_alpha))
-            faded_surface.blit(text_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        # Build, render and lay out the message only when the violations change
+        lines_key = (self._ball_conflicts_token, self._player_collisions_token)
+        if lines_key != self._warning_lines_key:
+            warning_lines = self._warning_lines()
+            warning_y = SCREEN_HEIGHT // 2 - int(SCREEN_HEIGHT * 0.40)
+            
+            # Font size reduced by 20% (from 48 to 38)
+            font_size = int(25)
+            font = self._font(font_size)
+            
+            line_height = font_size + 5
+            total_height = len(warning_lines) * line_height
+            start_y = warning_y - total_height // 2
             
-            # Center and draw the text
-            text_rect = faded_surface.get_rect(center=(SCREEN_WIDTH // 2, start_y + i * line_height))
-            screen.blit(faded_surface, text_rect)
\ No newline at end of file
+            self._warning_surfaces = []
+            for i, line in enumerate(warning_lines):
+                text_surface = font.render(line, True, RED)
+                # Center the text
+                text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, start_y + i * line_height))
+                self._warning_surfaces.append((text_surface, text_rect))
+            self._warning_lines_key = lines_key
+        
+        # Draw each line with the current fade alpha
+        for text_surface, text_rect in self._warning_surfaces:
+            text_surface.set_alpha(self.consolidated_warning_fade_alpha)
+            screen.blit(text_surface, text_rect)
\ No newline at end of file